@@ -10,8 +10,7 @@ import numpy as np
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 from pyshape import (
     load_stl,
-    surface_area,
-    surface_orientation_tensor,
+    mesh_stats,
     sphericity_wadell,
     sphericity_krumbein,
     form_parameters_potticary_et_al,
@@ -36,16 +35,6 @@ from matplotlib.figure import Figure
 from mpl_toolkits.mplot3d.art3d import Poly3DCollection
 
 
-def compute_volume_from_tri_mesh(nodes: np.ndarray, faces: np.ndarray) -> float:
-    """Compute signed volume of a closed triangle mesh.
-    Uses divergence theorem; positive if outward-facing normals.
-    """
-    v0 = nodes[faces[:, 0]]
-    v1 = nodes[faces[:, 1]]
-    v2 = nodes[faces[:, 2]]
-    return float(np.einsum('ij,ij->i', v0, np.cross(v1, v2)).sum() / 6.0)
-
-
 class ShapeGUI(TkinterDnD):
     def __init__(self):
         super().__init__()
@@ -56,6 +45,10 @@ class ShapeGUI(TkinterDnD):
         self.nodes = None
         self.faces = None
         self.current_file = None
+        # Derived quantities of the loaded mesh (area, volume, axes, ...),
+        # reset whenever a different file/units combination is loaded
+        self._mesh_key = None
+        self._mesh_cache = {}
 
         self._build_ui()
 
@@ -162,6 +155,12 @@ class ShapeGUI(TkinterDnD):
         if not p.exists():
             messagebox.showerror("Not found", f"File not found:\n{p}")
             return
+        st = p.stat()
+        key = (str(p.resolve()), st.st_mtime_ns, st.st_size, self.units_var.get())
+        if key == self._mesh_key and self.nodes is not None:
+            # Same unchanged file and units: keep the mesh and cached metrics
+            self._render_mesh()
+            return
         try:
             nodes, faces = load_stl(p)
         except Exception as e:
@@ -170,10 +169,11 @@ class ShapeGUI(TkinterDnD):
         self.current_file = str(p)
         # Units scaling (with simple auto heuristic)
         units = self.units_var.get()
+        # Bounding box, computed once per load and reused by the preview
+        mins = nodes.min(axis=0)
+        maxs = nodes.max(axis=0)
         if units == "auto":
             # Heuristic: guess mm if object is large in raw units
-            mins = nodes.min(axis=0)
-            maxs = nodes.max(axis=0)
             span = float((maxs - mins).max())
             if span > 10000:      # likely micrometers
                 scale = 1e-6
@@ -184,22 +184,28 @@ class ShapeGUI(TkinterDnD):
         else:
             scale = {"as-is": 1.0, "mm": 1e-3, "cm": 1e-2, "m": 1.0, "inch": 0.0254}.get(units, 1.0)
         if scale != 1.0:
-            nodes = nodes * scale
+            # load_stl returns fresh arrays owned by the viewer; scale in place
+            nodes *= scale
+            mins *= scale
+            maxs *= scale
         self.nodes, self.faces = nodes, faces
+        self._mesh_key = key
+        self._mesh_cache = {"bbox": (mins, maxs)}
         self._render_mesh()
 
     def _render_mesh(self):
         self.ax.clear()
         self.ax.set_title("Mesh preview (rotate/zoom with mouse)")
         if self.nodes is None or self.faces is None:
-            self.canvas.draw()
+            self.canvas.draw_idle()
             return
-        verts = [self.nodes[idx] for idx in self.faces]
+        # One (M, 3, 3) gather from the shared vertex array rather than a
+        # Python list of per-face arrays
+        verts = self.nodes[self.faces]
         coll = Poly3DCollection(verts, facecolors='lightsteelblue', edgecolors='k', linewidths=0.5, alpha=0.9)
         self.ax.add_collection3d(coll)
         # Auto-scale
-        mins = self.nodes.min(axis=0)
-        maxs = self.nodes.max(axis=0)
+        mins, maxs = self._cached("bbox", lambda: (self.nodes.min(axis=0), self.nodes.max(axis=0)))
         center = (mins + maxs) / 2.0
         size = (maxs - mins).max()
         if size <= 0:
@@ -209,7 +215,9 @@ class ShapeGUI(TkinterDnD):
         self.ax.set_ylim(*lims[1])
         self.ax.set_zlim(*lims[2])
         self.ax.set_box_aspect([1,1,1])
-        self.canvas.draw()
+        # Schedule the redraw for the next idle cycle instead of rendering
+        # synchronously; repeated requests collapse into one Agg render + blit
+        self.canvas.draw_idle()
 
     def calculate_metrics(self):
         if self.nodes is None or self.faces is None:
@@ -219,37 +227,25 @@ class ShapeGUI(TkinterDnD):
         if self.current_file:
             out.append(f"file = {Path(self.current_file).name}")
         try:
+            cache = self._mesh_cache
+            if self.var_area.get() or self.var_volume.get() or self.var_wadell.get() or self.var_orient.get():
+                # Area, volume and orientation tensor from one pass over the faces
+                A, V, C, F, R, vals, vecs = self._cached("stats", self._mesh_stats)
             if self.var_area.get():
-                A = surface_area(self.nodes, self.faces)
                 out.append(f"surface_area = {A:.6f}")
-            if self.var_volume.get() or self.var_wadell.get():
-                V = abs(compute_volume_from_tri_mesh(self.nodes, self.faces))
-                if self.var_volume.get():
-                    out.append(f"volume = {V:.6f}")
+            if self.var_volume.get():
+                out.append(f"volume = {V:.6f}")
             if self.var_wadell.get():
-                if 'A' not in locals():
-                    A = surface_area(self.nodes, self.faces)
-                if 'V' not in locals():
-                    V = abs(compute_volume_from_tri_mesh(self.nodes, self.faces))
                 phi = sphericity_wadell(V, A)
                 out.append(f"sphericity_wadell = {phi:.6f}")
             if self.var_orient.get():
-                C, F, R, vals, vecs = surface_orientation_tensor(self.nodes, self.faces)
                 out.append(f"orientation C={C:.6f}, F={F:.6f}, R={R:.6f}")
                 out.append(f"eigenvalues = [{vals[0]:.6f}, {vals[1]:.6f}, {vals[2]:.6f}]")
 
             # PCA-based axes estimation if any axis-dependent metrics are requested
             need_axes = self.var_spK.get() or self.var_params_p.get() or self.var_params_kf.get() or self.var_params_z.get() or self.var_show_axes.get()
             if need_axes:
-                # Estimate S,I,L using PCA extents
-                X = self.nodes - self.nodes.mean(axis=0)
-                # Principal directions (columns of V)
-                Vt = np.linalg.svd(X, full_matrices=False)[2]
-                coords = X @ Vt.T
-                spans = coords.max(axis=0) - coords.min(axis=0)
-                # Sort to get L >= I >= S
-                order = np.argsort(spans)
-                S_len, I_len, L_len = spans[order[0]], spans[order[1]], spans[order[2]]
+                S_len, I_len, L_len = self._cached("axes", self._estimate_axes)
                 if self.var_show_axes.get():
                     out.append(f"axes_estimated (S,I,L) = [{S_len:.6f}, {I_len:.6f}, {L_len:.6f}]")
 
@@ -267,39 +263,59 @@ class ShapeGUI(TkinterDnD):
                     out.append(f"Zingg: S/I={SIZ:.6f}, I/L={ILZ:.6f}")
 
             if self.var_convexity.get():
-                # Prefer SciPy convex hull if available; otherwise provide install hint
-                try:
-                    from scipy.spatial import ConvexHull  # type: ignore
-                    hull = ConvexHull(self.nodes)
-                    Vch = float(hull.volume)
-                    if 'V' not in locals():
-                        V = abs(compute_volume_from_tri_mesh(self.nodes, self.faces))
+                Vch = cache.get("hull_volume")
+                if Vch is None:
+                    # Prefer SciPy convex hull if available; otherwise provide install hint
+                    try:
+                        from scipy.spatial import ConvexHull  # type: ignore
+                        Vch = float(ConvexHull(self.nodes).volume)
+                    except ModuleNotFoundError:
+                        out.append("convexity: SciPy not installed; run 'pip install scipy' to enable")
+                    except Exception:
+                        # Fallback: try trimesh convex hull
+                        try:
+                            import trimesh
+                            mesh = trimesh.Trimesh(vertices=self.nodes, faces=self.faces, process=False)
+                            Vch = float(mesh.convex_hull.volume)
+                        except Exception as e2:
+                            out.append(f"convexity: error computing convex hull ({e2})")
+                    if Vch is not None:
+                        cache["hull_volume"] = Vch
+                if Vch is not None:
+                    V = self._cached("stats", self._mesh_stats)[1]
                     if Vch > 0:
                         out.append(f"convexity = {V / Vch:.6f} (V={V:.6f}, V_CH={Vch:.6f})")
                     else:
                         out.append("convexity: convex hull volume is zero")
-                except ModuleNotFoundError:
-                    out.append("convexity: SciPy not installed; run 'pip install scipy' to enable")
-                except Exception:
-                    # Fallback: try trimesh convex hull
-                    try:
-                        import trimesh
-                        mesh = trimesh.Trimesh(vertices=self.nodes, faces=self.faces, process=False)
-                        Vch = float(mesh.convex_hull.volume)
-                        if 'V' not in locals():
-                            V = abs(compute_volume_from_tri_mesh(self.nodes, self.faces))
-                        if Vch > 0:
-                            out.append(f"convexity = {V / Vch:.6f} (V={V:.6f}, V_CH={Vch:.6f})")
-                        else:
-                            out.append("convexity: convex hull volume is zero")
-                    except Exception as e2:
-                        out.append(f"convexity: error computing convex hull ({e2})")
         except Exception as e:
             messagebox.showerror("Compute error", str(e))
             return
         self.output.delete("1.0", tk.END)
         self.output.insert(tk.END, "\n".join(out))
 
+    def _cached(self, name, compute):
+        """Return a derived quantity of the loaded mesh, computing it on first use."""
+        if name not in self._mesh_cache:
+            self._mesh_cache[name] = compute()
+        return self._mesh_cache[name]
+
+    def _mesh_stats(self):
+        """mesh_stats of the loaded mesh, with the volume taken as unsigned."""
+        A, V, *orientation = mesh_stats(self.nodes, self.faces)
+        return (A, abs(V), *orientation)
+
+    def _estimate_axes(self):
+        """Estimate (S, I, L) as the node extents along the PCA directions."""
+        X = self.nodes - self.nodes.mean(axis=0)
+        # Principal directions: eigenvectors (columns) of the 3x3 scatter
+        # matrix X^T X, which equal the right singular vectors of X
+        _, axes = np.linalg.eigh(X.T @ X)
+        coords = X @ axes
+        spans = coords.max(axis=0) - coords.min(axis=0)
+        # Sort to get L >= I >= S
+        order = np.argsort(spans)
+        return spans[order[0]], spans[order[1]], spans[order[2]]
+
     def copy_results(self):
         text = self.output.get("1.0", tk.END)
         self.clipboard_clear()
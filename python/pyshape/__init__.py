@@ -1,11 +1,14 @@
-from .geometry import surface_area, volume_centroid_inertia_tensor
+from .geometry import surface_area, surface_area_batched, volume_centroid_inertia_tensor
 from .form import (
 	convexity,
 	sphericity_wadell,
 	sphericity_krumbein,
 	surface_orientation_tensor,
+	mesh_stats,
 	form_functions_1,
+	form_functions_1_batch,
 	form_functions_2,
+	form_functions_2_batch,
 	form_parameters_kong_and_fonseca,
 	form_parameters_potticary_et_al,
 	form_parameters_zingg,
@@ -15,13 +18,17 @@ from .roughness import sa, sq, sdq, sku, ssk, roughness_functions
 
 __all__ = [
 	"surface_area",
+	"surface_area_batched",
 	"volume_centroid_inertia_tensor",
 	"convexity",
 	"sphericity_wadell",
 	"sphericity_krumbein",
 	"surface_orientation_tensor",
+	"mesh_stats",
 	"form_functions_1",
+	"form_functions_1_batch",
 	"form_functions_2",
+	"form_functions_2_batch",
 	"form_parameters_kong_and_fonseca",
 	"form_parameters_potticary_et_al",
 	"form_parameters_zingg",
@@ -0,0 +1,83 @@
+"""Optional Numba kernels for :mod:`pyshape.form`.
+
+Importing this module never fails: when Numba is not installed ``HAS_NUMBA``
+is False and the kernels are None, so callers keep their NumPy path.
+"""
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange  # type: ignore
+    HAS_NUMBA = True
+except Exception:
+    njit = None
+    prange = range
+    HAS_NUMBA = False
+
+
+def _mesh_stats(nodes: np.ndarray, faces: np.ndarray):
+    """
+    Orientation tensor, surface area and six times the signed volume in one
+    pass over faces.
+
+    Returns (f, area, vol6) where f = sum_k A_k n_k n_k^T is not yet divided
+    by area and vol6 = sum_k a_k . v_k, with v_k = (b_k - a_k) x (c_k - a_k)
+    as in the NumPy path (form._face_cross). Zero-area faces add nothing to
+    f or area.
+    """
+    fxx = 0.0
+    fyy = 0.0
+    fzz = 0.0
+    fxy = 0.0
+    fxz = 0.0
+    fyz = 0.0
+    area = 0.0
+    vol6 = 0.0
+    for k in prange(faces.shape[0]):
+        a = faces[k, 0]
+        b = faces[k, 1]
+        c = faces[k, 2]
+        ax = nodes[a, 0]
+        ay = nodes[a, 1]
+        az = nodes[a, 2]
+        ux = nodes[b, 0] - ax
+        uy = nodes[b, 1] - ay
+        uz = nodes[b, 2] - az
+        wx = nodes[c, 0] - ax
+        wy = nodes[c, 1] - ay
+        wz = nodes[c, 2] - az
+        vx = uy * wz - uz * wy
+        vy = uz * wx - ux * wz
+        vz = ux * wy - uy * wx
+        # a . (b x c) = a . v
+        vol6 += ax * vx + ay * vy + az * vz
+        norm = math.sqrt(vx * vx + vy * vy + vz * vz)
+        if norm > 0.0:
+            # A_k n_k n_k^T with A_k = norm/2 and n_k = v/norm
+            s = 0.5 / norm
+            fxx += s * vx * vx
+            fyy += s * vy * vy
+            fzz += s * vz * vz
+            fxy += s * vx * vy
+            fxz += s * vx * vz
+            fyz += s * vy * vz
+            area += 0.5 * norm
+
+    f = np.empty((3, 3), dtype=np.float64)
+    f[0, 0] = fxx
+    f[1, 1] = fyy
+    f[2, 2] = fzz
+    f[0, 1] = fxy
+    f[1, 0] = fxy
+    f[0, 2] = fxz
+    f[2, 0] = fxz
+    f[1, 2] = fyz
+    f[2, 1] = fyz
+    return f, area, vol6
+
+
+if HAS_NUMBA:
+    mesh_stats = njit(parallel=True, fastmath=True, cache=True)(_mesh_stats)
+else:
+    mesh_stats = None
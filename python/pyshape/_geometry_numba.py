@@ -0,0 +1,124 @@
+"""Optional Numba kernels for :mod:`pyshape.geometry`.
+
+Importing this module never fails: when Numba is not installed ``HAS_NUMBA``
+is False and the kernels are None, so callers keep their NumPy path.
+"""
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange  # type: ignore
+    HAS_NUMBA = True
+except Exception:
+    njit = None
+    prange = range
+    HAS_NUMBA = False
+
+
+def _surface_area(nodes: np.ndarray, faces: np.ndarray) -> float:
+    """Total triangle area in one pass over faces, without temporaries."""
+    total = 0.0
+    for k in prange(faces.shape[0]):
+        a = faces[k, 0]
+        b = faces[k, 1]
+        c = faces[k, 2]
+        ux = nodes[b, 0] - nodes[a, 0]
+        uy = nodes[b, 1] - nodes[a, 1]
+        uz = nodes[b, 2] - nodes[a, 2]
+        wx = nodes[c, 0] - nodes[a, 0]
+        wy = nodes[c, 1] - nodes[a, 1]
+        wz = nodes[c, 2] - nodes[a, 2]
+        cx = uy * wz - uz * wy
+        cy = uz * wx - ux * wz
+        cz = ux * wy - uy * wx
+        total += 0.5 * math.sqrt(cx * cx + cy * cy + cz * cz)
+    return total
+
+
+def _tet_moments(nodes: np.ndarray, elements: np.ndarray, ref: np.ndarray):
+    """
+    Volume, first and second moments of a tetra mesh in one pass over elements.
+
+    Coordinates are taken relative to ``ref``. Returns
+    (V, Mx, My, Mz, Mxx, Myy, Mzz, Mxy, Mxz, Myz) with V the sum of absolute
+    tetra volumes, M_i the integral of x_i and M_ij the integral of x_i x_j,
+    using the same Tonon (2005)-style per-tetra formulas as the NumPy path.
+    """
+    rx = ref[0]
+    ry = ref[1]
+    rz = ref[2]
+    V = 0.0
+    Mx = 0.0
+    My = 0.0
+    Mz = 0.0
+    Mxx = 0.0
+    Myy = 0.0
+    Mzz = 0.0
+    Mxy = 0.0
+    Mxz = 0.0
+    Myz = 0.0
+    for k in prange(elements.shape[0]):
+        a = elements[k, 0]
+        b = elements[k, 1]
+        c = elements[k, 2]
+        d = elements[k, 3]
+        x0 = nodes[a, 0] - rx
+        y0 = nodes[a, 1] - ry
+        z0 = nodes[a, 2] - rz
+        x1 = nodes[b, 0] - rx
+        y1 = nodes[b, 1] - ry
+        z1 = nodes[b, 2] - rz
+        x2 = nodes[c, 0] - rx
+        y2 = nodes[c, 1] - ry
+        z2 = nodes[c, 2] - rz
+        x3 = nodes[d, 0] - rx
+        y3 = nodes[d, 1] - ry
+        z3 = nodes[d, 2] - rz
+
+        # |(a-d) . ((b-d) x (c-d))| / 6
+        adx = x0 - x3
+        ady = y0 - y3
+        adz = z0 - z3
+        bdx = x1 - x3
+        bdy = y1 - y3
+        bdz = z1 - z3
+        cdx = x2 - x3
+        cdy = y2 - y3
+        cdz = z2 - z3
+        v = abs(
+            adx * (bdy * cdz - bdz * cdy)
+            + ady * (bdz * cdx - bdx * cdz)
+            + adz * (bdx * cdy - bdy * cdx)
+        ) / 6.0
+
+        Sx = x0 + x1 + x2 + x3
+        Sy = y0 + y1 + y2 + y3
+        Sz = z0 + z1 + z2 + z3
+        Sxx = x0 * x0 + x1 * x1 + x2 * x2 + x3 * x3
+        Syy = y0 * y0 + y1 * y1 + y2 * y2 + y3 * y3
+        Szz = z0 * z0 + z1 * z1 + z2 * z2 + z3 * z3
+        Sxy = x0 * y0 + x1 * y1 + x2 * y2 + x3 * y3
+        Sxz = x0 * z0 + x1 * z1 + x2 * z2 + x3 * z3
+        Syz = y0 * z0 + y1 * z1 + y2 * z2 + y3 * z3
+
+        coef = v / 20.0
+        V += v
+        Mx += 0.25 * v * Sx
+        My += 0.25 * v * Sy
+        Mz += 0.25 * v * Sz
+        Mxx += coef * (Sx * Sx + Sxx)
+        Myy += coef * (Sy * Sy + Syy)
+        Mzz += coef * (Sz * Sz + Szz)
+        Mxy += coef * (Sx * Sy + Sxy)
+        Mxz += coef * (Sx * Sz + Sxz)
+        Myz += coef * (Sy * Sz + Syz)
+    return V, Mx, My, Mz, Mxx, Myy, Mzz, Mxy, Mxz, Myz
+
+
+if HAS_NUMBA:
+    surface_area = njit(parallel=True, fastmath=True, cache=True)(_surface_area)
+    tet_moments = njit(parallel=True, fastmath=True, cache=True)(_tet_moments)
+else:
+    surface_area = None
+    tet_moments = None
@@ -1,12 +1,41 @@
 import numpy as np
 from typing import Tuple
 
+from . import geometry
+from .geometry import _numba_kernel, _prepare
+
+
+# Unchecked formulas shared by the scalar functions, the form_functions_*
+# wrappers and their _batch variants, which validate their inputs once.
+# They accept Python floats or NumPy arrays.
+
+def _cbrt(x):
+    # ** (1/3) is several times faster than np.cbrt on Python floats;
+    # np.cbrt is faster on arrays. Inputs here are non-negative.
+    if isinstance(x, np.ndarray):
+        return np.cbrt(x)
+    return x ** (1.0 / 3.0)
+
+
+def _convexity_nochk(volume, volume_convex_hull):
+    return volume / volume_convex_hull
+
+
+def _wadell_nochk(volume, surface_area):
+    # Equivalent to phi = pi^(1/3) * (6V)^(2/3) / A
+    return 6.0 * volume / (_cbrt(6.0 * volume / np.pi) * surface_area)
+
+
+def _krumbein_nochk(S, I, L):
+    return _cbrt((I * S) / (L * L))
+
+
 def convexity(volume: float, volume_convex_hull: float) -> float:
     if volume_convex_hull <= 0:
         raise ValueError("volume_convex_hull must be > 0")
     if volume < 0:
         raise ValueError("volume must be >= 0")
-    return float(volume / volume_convex_hull)
+    return float(_convexity_nochk(volume, volume_convex_hull))
 
 
 def sphericity_wadell(volume: float, surface_area: float) -> float:
@@ -14,14 +43,62 @@ def sphericity_wadell(volume: float, surface_area: float) -> float:
         raise ValueError("volume must be >= 0")
     if surface_area <= 0:
         raise ValueError("surface_area must be > 0")
-    # Equivalent to phi = pi^(1/3) * (6V)^(2/3) / A
-    return float(6.0 * volume / (((6.0 * volume / np.pi) ** (1.0 / 3.0)) * surface_area))
+    return float(_wadell_nochk(volume, surface_area))
 
 
 def sphericity_krumbein(S: float, I: float, L: float) -> float:
     if L <= 0 or I < 0 or S < 0:
         raise ValueError("dimensions must be non-negative and L > 0")
-    return float(((I * S) / (L * L)) ** (1.0 / 3.0))
+    return float(_krumbein_nochk(S, I, L))
+
+
+def _face_cross(nodes: np.ndarray, faces: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    First vertex a, cross product v = (b - a) x (c - a) and |v| per face.
+
+    |v| is twice the face area and v/|v| the unit normal. Expects prepared
+    (float64, 0-based) input.
+    """
+    a = nodes[faces[:, 0]]
+    e1 = nodes[faces[:, 1]] - a
+    e2 = nodes[faces[:, 2]] - a
+    # e1 x e2, written out per component
+    v = np.empty_like(e1)
+    v[:, 0] = e1[:, 1] * e2[:, 2] - e1[:, 2] * e2[:, 1]
+    v[:, 1] = e1[:, 2] * e2[:, 0] - e1[:, 0] * e2[:, 2]
+    v[:, 2] = e1[:, 0] * e2[:, 1] - e1[:, 1] * e2[:, 0]
+    norms = np.sqrt(np.einsum('ij,ij->i', v, v))
+    return a, v, norms
+
+
+def _orientation_tensor(v: np.ndarray, norms: np.ndarray, total_area: float) -> np.ndarray:
+    """
+    Orientation tensor f = (1/A) sum_k A_k n_k n_k^T from face cross products.
+
+    With A_k = |v_k|/2 and n_k = v_k/|v_k| each term is (0.5/|v_k|) v_k v_k^T,
+    so the normals are never formed; zero-area faces get weight 0.
+    """
+    w = np.divide(0.5, norms, out=np.zeros_like(norms), where=norms > 0)
+    # sum_k w_k v_k v_k^T = V^T diag(w) V: one (3, M) x (M, 3) BLAS product,
+    # with no (M, 3, 3) outer products and no einsum path planning
+    return ((v * w[:, None]).T @ v) / total_area
+
+
+def _orientation_indices(f: np.ndarray) -> Tuple[float, float, float, np.ndarray, np.ndarray]:
+    """C, F, R and the descending eigenpairs of an orientation tensor f."""
+    # f is symmetric positive semidefinite, so its SVD f = U diag(s) U^T is
+    # its eigen decomposition with eigenvalues already in descending order
+    eigen_vectors, eigen_values, _ = np.linalg.svd(f)
+
+    f1, f2, f3 = eigen_values
+    # Avoid division by zero: f1 should be > 0 for a valid tensor
+    if f1 <= 0:
+        raise ValueError("largest eigenvalue non-positive; invalid orientation tensor")
+
+    C = float(f3 / f1)
+    F = float((f1 - f2) / f1)
+    R = float((f2 - f3) / f1)
+    return C, F, R, eigen_values, eigen_vectors
 
 
 def surface_orientation_tensor(nodes: np.ndarray, faces: np.ndarray) -> Tuple[float, float, float, np.ndarray, np.ndarray]:
@@ -40,60 +117,66 @@ def surface_orientation_tensor(nodes: np.ndarray, faces: np.ndarray) -> Tuple[fl
     eigen_values : (3,) array, descending
     eigen_vectors : (3,3) array, columns correspond to eigen_values order
     """
-    nodes = np.asarray(nodes, dtype=float)
-    faces = np.asarray(faces, dtype=int)
-
-    if nodes.ndim != 2 or nodes.shape[1] != 3:
-        raise ValueError("nodes must have shape (N, 3)")
-    if faces.ndim != 2 or faces.shape[1] != 3:
-        raise ValueError("faces must have shape (M, 3)")
-
-    # Auto-detect 1-based indexing
-    if faces.size and faces.min() == 1 and faces.max() == nodes.shape[0]:
-        faces = faces - 1
-    if faces.size and (faces.min() < 0 or faces.max() >= nodes.shape[0]):
-        raise ValueError("face indices out of range for nodes array")
-
-    # Triangle normals and areas
-    A = nodes[faces[:, 0]]
-    B = nodes[faces[:, 1]]
-    Cn = nodes[faces[:, 2]]
-    e_AB = B - A
-    e_BC = Cn - B
-    v = np.cross(e_AB, e_BC)
-    areas = 0.5 * np.linalg.norm(v, axis=1)
-
-    # normals normalized; handle zero-area faces safely
-    norms = np.linalg.norm(v, axis=1)
-    with np.errstate(invalid='ignore', divide='ignore'):
-        n = np.divide(v, norms[:, None], out=np.zeros_like(v), where=norms[:, None] > 0)
-
-    total_area = areas.sum()
-    if total_area <= 0:
-        raise ValueError("total surface area is zero; mesh may be degenerate")
-
-    # Orientation tensor f = (1/A) sum_k A_k n_k n_k^T
-    f = np.zeros((3, 3), dtype=float)
-    for k in range(n.shape[0]):
-        nk = n[k][:, None]
-        f += areas[k] * (nk @ nk.T)
-    f /= total_area
-
-    # Eigen decomposition and sort descending
-    vals, vecs = np.linalg.eig(f)
-    order = np.argsort(vals)[::-1]
-    eigen_values = np.real(vals[order])
-    eigen_vectors = np.real(vecs[:, order])
+    nodes, faces = _prepare(nodes, faces, "face")
 
-    f1, f2, f3 = eigen_values
-    # Avoid division by zero: f1 should be > 0 for a valid tensor
-    if f1 <= 0:
-        raise ValueError("largest eigenvalue non-positive; invalid orientation tensor")
+    kernel = _numba_kernel("_form_numba", "mesh_stats", faces.shape[0], geometry._NUMBA_MIN_FACES)
+    if kernel is not None:
+        # The fused kernel's extra volume sum is negligible next to the gathers
+        f, total_area, _ = kernel(nodes, faces)
+        if total_area <= 0:
+            raise ValueError("total surface area is zero; mesh may be degenerate")
+        f /= total_area
+    else:
+        _, v, norms = _face_cross(nodes, faces)
+        total_area = 0.5 * norms.sum()
+        if total_area <= 0:
+            raise ValueError("total surface area is zero; mesh may be degenerate")
+        f = _orientation_tensor(v, norms, total_area)
 
-    C = float(f3 / f1)
-    F = float((f1 - f2) / f1)
-    R = float((f2 - f3) / f1)
-    return C, F, R, eigen_values, eigen_vectors
+    return _orientation_indices(f)
+
+
+def mesh_stats(nodes: np.ndarray, faces: np.ndarray) -> Tuple[float, float, float, float, float, np.ndarray, np.ndarray]:
+    """
+    Surface area, enclosed volume and surface orientation tensor results
+    of a closed triangle mesh, from a single pass over the faces.
+
+    Equivalent to calling surface_area, a divergence-theorem volume and
+    surface_orientation_tensor, which would each gather the face vertices
+    and cross products again.
+
+    Parameters
+    ----------
+    nodes : (N,3) float array
+    faces : (M,3) int array (0-based). 1-based faces are auto-detected and converted.
+
+    Returns
+    -------
+    area : float
+        Total surface area.
+    signed_volume : float
+        Enclosed volume, positive when face normals point outward.
+    C, F, R, eigen_values, eigen_vectors
+        As returned by surface_orientation_tensor.
+    """
+    nodes, faces = _prepare(nodes, faces, "face")
+
+    kernel = _numba_kernel("_form_numba", "mesh_stats", faces.shape[0], geometry._NUMBA_MIN_FACES)
+    if kernel is not None:
+        f, area, vol6 = kernel(nodes, faces)
+        if area <= 0:
+            raise ValueError("total surface area is zero; mesh may be degenerate")
+        f /= area
+    else:
+        a, v, norms = _face_cross(nodes, faces)
+        area = 0.5 * norms.sum()
+        if area <= 0:
+            raise ValueError("total surface area is zero; mesh may be degenerate")
+        # a . v = a . (b x c), so the volume reuses the cross products
+        vol6 = np.einsum('ij,ij->', a, v)
+        f = _orientation_tensor(v, norms, area)
+
+    return (float(area), float(vol6 / 6.0)) + _orientation_indices(f)
 
 
 def form_functions_1(surface_area: float, volume: float, volume_convex_hull: float) -> Tuple[float, float]:
@@ -104,9 +187,46 @@ def form_functions_1(surface_area: float, volume: float, volume_convex_hull: flo
     -------
     convexity, sphericity_wadell
     """
-    con = convexity(volume, volume_convex_hull)
-    spW = sphericity_wadell(volume, surface_area)
-    return con, spW
+    # Checks of convexity and sphericity_wadell, done once
+    if volume_convex_hull <= 0:
+        raise ValueError("volume_convex_hull must be > 0")
+    if volume < 0:
+        raise ValueError("volume must be >= 0")
+    if surface_area <= 0:
+        raise ValueError("surface_area must be > 0")
+    con = _convexity_nochk(volume, volume_convex_hull)
+    spW = _wadell_nochk(volume, surface_area)
+    return float(con), float(spW)
+
+
+def form_functions_1_batch(
+    surface_area: np.ndarray, volume: np.ndarray, volume_convex_hull: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorised form_functions_1 for many particles at once.
+
+    Parameters
+    ----------
+    surface_area, volume, volume_convex_hull : array_like
+        Per-particle values; broadcast against each other.
+
+    Returns
+    -------
+    convexity, sphericity_wadell : ndarrays
+    """
+    A, V, Vch = np.broadcast_arrays(
+        np.asarray(surface_area, dtype=float),
+        np.asarray(volume, dtype=float),
+        np.asarray(volume_convex_hull, dtype=float),
+    )
+    if np.any(Vch <= 0):
+        raise ValueError("volume_convex_hull must be > 0")
+    if np.any(V < 0):
+        raise ValueError("volume must be >= 0")
+    if np.any(A <= 0):
+        raise ValueError("surface_area must be > 0")
+
+    return _convexity_nochk(V, Vch), _wadell_nochk(V, A)
 
 
 def form_functions_2(S: float, I: float, L: float) -> Tuple[float, float, float, float, float, float, float]:
@@ -117,10 +237,54 @@ def form_functions_2(S: float, I: float, L: float) -> Tuple[float, float, float,
     -------
     spK, flP, elP, flK, elK, SIZ, ILZ
     """
-    spK = sphericity_krumbein(S, I, L)
-    flP, elP = form_parameters_potticary_et_al(S, I, L)
-    flK, elK = form_parameters_kong_and_fonseca(S, I, L)
-    SIZ, ILZ = form_parameters_zingg(S, I, L)
+    # Single arithmetic block equivalent to sphericity_krumbein and the
+    # form_parameters_* functions, sharing the checks and common terms.
+    if L <= 0 or I < 0 or S < 0:
+        raise ValueError("dimensions must be non-negative and L > 0")
+    spK = _krumbein_nochk(S, I, L)
+    denom = L + I + S
+    flP = 2.0 * (I - S) / denom
+    elP = (L - I) / denom
+    if I != 0:
+        flK = (I - S) / I
+        SIZ = S / I
+    else:
+        flK = SIZ = 0.0
+    elK = (L - I) / L
+    ILZ = I / L
+    return float(spK), float(flP), float(elP), float(flK), float(elK), float(SIZ), float(ILZ)
+
+
+def form_functions_2_batch(S: np.ndarray, I: np.ndarray, L: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    Vectorised form_functions_2 for many particles at once.
+
+    Parameters
+    ----------
+    S, I, L : array_like
+        Short, intermediate and long dimensions; broadcast against each other.
+
+    Returns
+    -------
+    spK, flP, elP, flK, elK, SIZ, ILZ : ndarrays
+        Same quantities as form_functions_2, element-wise. Ratios with I = 0
+        are 0, as in the scalar functions.
+    """
+    S, I, L = np.broadcast_arrays(
+        np.asarray(S, dtype=float), np.asarray(I, dtype=float), np.asarray(L, dtype=float)
+    )
+    if np.any(L <= 0) or np.any(I < 0) or np.any(S < 0):
+        raise ValueError("dimensions must be non-negative and L > 0")
+
+    spK = _krumbein_nochk(S, I, L)
+    denom = L + I + S
+    flP = 2.0 * (I - S) / denom
+    elP = (L - I) / denom
+    nz = I != 0
+    flK = np.divide(I - S, I, out=np.zeros_like(I), where=nz)
+    elK = (L - I) / L
+    SIZ = np.divide(S, I, out=np.zeros_like(I), where=nz)
+    ILZ = I / L
     return spK, flP, elP, flK, elK, SIZ, ILZ
 
 
@@ -1,6 +1,73 @@
+import importlib
+import importlib.util
+
 import numpy as np
 from typing import Iterable, Tuple
 
+# Numba is optional and slow to import, so only check that it is installed;
+# the kernel modules (and numba) are imported by the first call that needs them.
+HAS_NUMBA = importlib.util.find_spec("numba") is not None
+
+# Meshes with at least this many faces/elements use the Numba kernels when
+# available; smaller ones stay on NumPy so short calls do not pay JIT compilation.
+_NUMBA_MIN_FACES = 10_000
+_NUMBA_MIN_ELEMENTS = 1_000
+
+
+def _numba_kernel(module: str, name: str, size: int, min_size: int):
+    """
+    Return kernel ``name`` from the private module ``pyshape.<module>``, or None.
+
+    None means "use NumPy": Numba is not installed, the mesh is below
+    ``min_size``, or numba failed to import (the module then sets it to None).
+    """
+    if not HAS_NUMBA or size < min_size:
+        return None
+    return getattr(importlib.import_module(f".{module}", __package__), name)
+
+
+def _zero_based(indices: np.ndarray, n_nodes: int, name: str) -> np.ndarray:
+    """
+    Return connectivity as 0-based indices, validated against n_nodes.
+
+    1-based input (common in MATLAB) is detected and converted. The min and
+    max are taken once and reused for both the detection and the range check.
+    """
+    if not indices.size:
+        return indices
+    imin = int(indices.min())
+    imax = int(indices.max())
+    if imin == 1 and imax == n_nodes:
+        indices = indices - 1
+        imin -= 1
+        imax -= 1
+    if imin < 0 or imax >= n_nodes:
+        raise ValueError(f"{name} indices out of range for nodes array")
+    return indices
+
+
+def _prepare(nodes: np.ndarray, indices: np.ndarray, kind: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Normalize mesh input once at the entry of a public function.
+
+    Returns C-contiguous float64 nodes and int64 connectivity (so the Numba
+    kernels compile, and cache, a single specialization), after checking
+    shapes and converting 1-based connectivity. ``kind`` is "face" (M, 3)
+    or "element" (M, 4).
+    """
+    nodes = np.ascontiguousarray(nodes, dtype=np.float64)
+    indices = np.ascontiguousarray(indices, dtype=np.int64)
+    n_cols = 3 if kind == "face" else 4
+
+    if nodes.ndim != 2 or nodes.shape[1] != 3:
+        raise ValueError("nodes must have shape (N, 3)")
+    if indices.ndim != 2 or indices.shape[1] != n_cols:
+        raise ValueError(f"{kind}s must have shape (M, {n_cols})")
+
+    # Auto-detect 1-based indexing (common in MATLAB) and convert to 0-based.
+    return nodes, _zero_based(indices, nodes.shape[0], kind)
+
+
 def surface_area(nodes: np.ndarray, faces: np.ndarray) -> float:
     """
     Compute the surface area of a 3-D triangular surface mesh.
@@ -18,27 +85,66 @@ def surface_area(nodes: np.ndarray, faces: np.ndarray) -> float:
     float
         Total surface area.
     """
-    nodes = np.asarray(nodes, dtype=float)
-    faces = np.asarray(faces, dtype=int)
+    nodes, faces = _prepare(nodes, faces, "face")
 
-    if nodes.ndim != 2 or nodes.shape[1] != 3:
-        raise ValueError("nodes must have shape (N, 3)")
-    if faces.ndim != 2 or faces.shape[1] != 3:
-        raise ValueError("faces must have shape (M, 3)")
+    kernel = _numba_kernel("_geometry_numba", "surface_area", faces.shape[0], _NUMBA_MIN_FACES)
+    if kernel is not None:
+        return float(kernel(nodes, faces))
+
+    return float(_face_areas(nodes, faces).sum())
 
-    # Auto-detect 1-based indexing (common in MATLAB) and convert to 0-based.
-    if faces.size and faces.min() == 1 and faces.max() == nodes.shape[0]:
-        faces = faces - 1
 
-    if faces.size and (faces.min() < 0 or faces.max() >= nodes.shape[0]):
-        raise ValueError("face indices out of range for nodes array")
+def surface_area_batched(nodes: np.ndarray, faces: np.ndarray, face_offsets: np.ndarray) -> np.ndarray:
+    """
+    Surface areas of many triangular meshes stored back to back.
+
+    Parameters
+    ----------
+    nodes : (N, 3) array_like of float
+        Vertex coordinates of all meshes, concatenated.
+    faces : (M, 3) array_like of int
+        Triangle vertex indices into the concatenated ``nodes`` (0-based).
+        If 1-based indices are detected, they will be converted automatically.
+    face_offsets : (P,) array_like of int
+        Index of the first face of each mesh in ``faces``, non-decreasing.
+        Mesh ``i`` owns ``faces[face_offsets[i]:face_offsets[i + 1]]``.
+
+    Returns
+    -------
+    (P,) ndarray
+        Surface area of each mesh (0 for a mesh without faces).
+    """
+    nodes, faces = _prepare(nodes, faces, "face")
+    offsets = np.asarray(face_offsets, dtype=np.int64)
+    if offsets.ndim != 1:
+        raise ValueError("face_offsets must be 1-D")
+    n_faces = faces.shape[0]
+    if offsets.size and (offsets[0] < 0 or offsets[-1] > n_faces or np.any(np.diff(offsets) < 0)):
+        raise ValueError("face_offsets must be non-decreasing and within [0, len(faces)]")
+    areas = np.zeros(offsets.size, dtype=float)
+    # Offsets equal to len(faces) can only be trailing empty meshes
+    starts = offsets < n_faces
+    if not starts.any():
+        return areas
+
+    # One segmented sum over all faces; reduceat yields faces[o] rather than 0
+    # for empty segments, so those are cleared afterwards
+    areas[starts] = np.add.reduceat(_face_areas(nodes, faces), offsets[starts])
+    areas[np.diff(offsets, append=n_faces) == 0] = 0.0
+    return areas
 
-    v1 = nodes[faces[:, 1]] - nodes[faces[:, 0]]
-    v2 = nodes[faces[:, 2]] - nodes[faces[:, 0]]
 
-    cross_prod = np.cross(v1, v2)
-    areas = 0.5 * np.linalg.norm(cross_prod, axis=1)
-    return float(areas.sum())
+def _face_areas(nodes: np.ndarray, faces: np.ndarray) -> np.ndarray:
+    """Per-face triangle areas for prepared (float64, 0-based) input."""
+    p0 = nodes[faces[:, 0]]
+    v1 = nodes[faces[:, 1]] - p0
+    v2 = nodes[faces[:, 2]] - p0
+
+    # v1 x v2, written out per component
+    cx = v1[:, 1] * v2[:, 2] - v1[:, 2] * v2[:, 1]
+    cy = v1[:, 2] * v2[:, 0] - v1[:, 0] * v2[:, 2]
+    cz = v1[:, 0] * v2[:, 1] - v1[:, 1] * v2[:, 0]
+    return 0.5 * np.sqrt(cx * cx + cy * cy + cz * cz)
 
 
 def volume_centroid_inertia_tensor(
@@ -74,84 +180,105 @@ def volume_centroid_inertia_tensor(
     principal_orientations : (3,3) ndarray
         Columns are the unit eigenvectors (principal axes), matching the eigenvalues order.
     """
-    nodes = np.asarray(nodes, dtype=float)
-    elements = np.asarray(elements, dtype=int)
+    nodes, elements = _prepare(nodes, elements, "element")
 
-    if nodes.ndim != 2 or nodes.shape[1] != 3:
-        raise ValueError("nodes must have shape (N, 3)")
-    if elements.ndim != 2 or elements.shape[1] != 4:
-        raise ValueError("elements must have shape (M, 4)")
-
-    # Auto-detect 1-based indexing and convert to 0-based.
-    if elements.size and elements.min() == 1 and elements.max() == nodes.shape[0]:
-        elements = elements - 1
-
-    if elements.size and (elements.min() < 0 or elements.max() >= nodes.shape[0]):
-        raise ValueError("element indices out of range for nodes array")
-
-    # Gather vertices per tetra
-    a = nodes[elements[:, 0]]
-    b = nodes[elements[:, 1]]
-    c = nodes[elements[:, 2]]
-    d = nodes[elements[:, 3]]
-
-    # Volumes via scalar triple product: |(a-d) . ((b-d) x (c-d))| / 6
-    ad = a - d
-    bd = b - d
-    cd = c - d
-    v = np.abs(np.einsum('ij,ij->i', np.cross(bd, cd), ad)) / 6.0
-    volume = float(v.sum())
-
-    if volume <= 0.0:
-        raise ValueError("Total volume is zero or negative; check elements or degeneracy.")
-
-    # Centroids of tets and volume-weighted sum
-    tet_centroids = (a + b + c + d) / 4.0
-    centroid = (v[:, None] * tet_centroids).sum(axis=0) / volume
-
-    if not calculate_inertia:
-        Z = np.zeros((3, 3), dtype=float)
-        return volume, centroid, Z, Z, Z
-
-    # Shift coordinates so centroid is at the origin
-    nodes_c = nodes - centroid[None, :]
-    a = nodes_c[elements[:, 0]]
-    b = nodes_c[elements[:, 1]]
-    c = nodes_c[elements[:, 2]]
-    d = nodes_c[elements[:, 3]]
-
-    # Per-tetra coordinate arrays
-    x = np.stack([a[:, 0], b[:, 0], c[:, 0], d[:, 0]], axis=1)
-    y = np.stack([a[:, 1], b[:, 1], c[:, 1], d[:, 1]], axis=1)
-    z = np.stack([a[:, 2], b[:, 2], c[:, 2], d[:, 2]], axis=1)
-
-    Sx = x.sum(axis=1)
-    Sy = y.sum(axis=1)
-    Sz = z.sum(axis=1)
-    Sxx = (x * x).sum(axis=1)
-    Syy = (y * y).sum(axis=1)
-    Szz = (z * z).sum(axis=1)
-    Sxy = (x * y).sum(axis=1)
-    Sxz = (x * z).sum(axis=1)
-    Syz = (y * z).sum(axis=1)
-
-    # Tonon (2005)-style discrete tetra integrals, vectorized
-    coef = v / 20.0  # since 6*v/120 = v/20; for Ixx/Iyy/Izz also matches v/20 using identities
-
-    Ixx_t = coef * (Sy * Sy + Syy + Sz * Sz + Szz)
-    Iyy_t = coef * (Sx * Sx + Sxx + Sz * Sz + Szz)
-    Izz_t = coef * (Sx * Sx + Sxx + Sy * Sy + Syy)
-
-    Ixy_t = coef * (Sx * Sy + Sxy)
-    Ixz_t = coef * (Sx * Sz + Sxz)
-    Iyz_t = coef * (Sy * Sz + Syz)
-
-    Ixx = float(Ixx_t.sum())
-    Iyy = float(Iyy_t.sum())
-    Izz = float(Izz_t.sum())
-    Ixy = float(Ixy_t.sum())
-    Ixz = float(Ixz_t.sum())
-    Iyz = float(Iyz_t.sum())
+    kernel = _numba_kernel("_geometry_numba", "tet_moments", elements.shape[0], _NUMBA_MIN_ELEMENTS)
+    if kernel is not None:
+        # One fused pass for volume, first and second moments. Moments are
+        # taken about a mesh vertex rather than the origin to limit cancellation.
+        ref = nodes[elements[0, 0]]
+        m = kernel(nodes, elements, ref)
+        volume = float(m[0])
+
+        if volume <= 0.0:
+            raise ValueError("Total volume is zero or negative; check elements or degeneracy.")
+
+        c = np.array(m[1:4], dtype=float) / volume  # centroid relative to ref
+        centroid = ref + c
+
+        if not calculate_inertia:
+            Z = np.zeros((3, 3), dtype=float)
+            return volume, centroid, Z, Z, Z
+
+        # Second moments about the centroid (parallel axis theorem)
+        Cxx = m[4] - volume * c[0] * c[0]
+        Cyy = m[5] - volume * c[1] * c[1]
+        Czz = m[6] - volume * c[2] * c[2]
+        Ixx = float(Cyy + Czz)
+        Iyy = float(Cxx + Czz)
+        Izz = float(Cxx + Cyy)
+        Ixy = float(m[7] - volume * c[0] * c[1])
+        Ixz = float(m[8] - volume * c[0] * c[2])
+        Iyz = float(m[9] - volume * c[1] * c[2])
+    else:
+        # Coordinates split into three contiguous axis arrays, so each gather
+        # below is a unit-stride (M, 4) block per axis instead of stride-3 views
+        xs, ys, zs = np.ascontiguousarray(nodes.T)
+        x = xs[elements]
+        y = ys[elements]
+        z = zs[elements]
+
+        # Volumes via scalar triple product: |(a-d) . ((b-d) x (c-d))| / 6
+        adx = x[:, 0] - x[:, 3]
+        ady = y[:, 0] - y[:, 3]
+        adz = z[:, 0] - z[:, 3]
+        bdx = x[:, 1] - x[:, 3]
+        bdy = y[:, 1] - y[:, 3]
+        bdz = z[:, 1] - z[:, 3]
+        cdx = x[:, 2] - x[:, 3]
+        cdy = y[:, 2] - y[:, 3]
+        cdz = z[:, 2] - z[:, 3]
+        v = np.abs(
+            adx * (bdy * cdz - bdz * cdy)
+            + ady * (bdz * cdx - bdx * cdz)
+            + adz * (bdx * cdy - bdy * cdx)
+        ) / 6.0
+        volume = float(v.sum())
+
+        if volume <= 0.0:
+            raise ValueError("Total volume is zero or negative; check elements or degeneracy.")
+
+        # Volume-weighted sum of tetra centroids (vertex means)
+        centroid = np.array(
+            [v @ x.sum(axis=1), v @ y.sum(axis=1), v @ z.sum(axis=1)]
+        ) / (4.0 * volume)
+
+        if not calculate_inertia:
+            Z = np.zeros((3, 3), dtype=float)
+            return volume, centroid, Z, Z, Z
+
+        # Per-tetra coordinates (M, 4) shifted so the centroid is at the origin
+        x -= centroid[0]
+        y -= centroid[1]
+        z -= centroid[2]
+
+        Sx = x.sum(axis=1)
+        Sy = y.sum(axis=1)
+        Sz = z.sum(axis=1)
+        Sxx = (x * x).sum(axis=1)
+        Syy = (y * y).sum(axis=1)
+        Szz = (z * z).sum(axis=1)
+        Sxy = (x * y).sum(axis=1)
+        Sxz = (x * z).sum(axis=1)
+        Syz = (y * z).sum(axis=1)
+
+        # Tonon (2005)-style discrete tetra integrals, vectorized
+        coef = v / 20.0  # since 6*v/120 = v/20; for Ixx/Iyy/Izz also matches v/20 using identities
+
+        Ixx_t = coef * (Sy * Sy + Syy + Sz * Sz + Szz)
+        Iyy_t = coef * (Sx * Sx + Sxx + Sz * Sz + Szz)
+        Izz_t = coef * (Sx * Sx + Sxx + Sy * Sy + Syy)
+
+        Ixy_t = coef * (Sx * Sy + Sxy)
+        Ixz_t = coef * (Sx * Sz + Sxz)
+        Iyz_t = coef * (Sy * Sz + Syz)
+
+        Ixx = float(Ixx_t.sum())
+        Iyy = float(Iyy_t.sum())
+        Izz = float(Izz_t.sum())
+        Ixy = float(Ixy_t.sum())
+        Ixz = float(Ixz_t.sum())
+        Iyz = float(Iyz_t.sum())
 
     current_inertia = np.array(
         [
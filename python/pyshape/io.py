@@ -1,71 +1,102 @@
 from __future__ import annotations
 from pathlib import Path
-from typing import Tuple
+from typing import Optional, Tuple
+import re
 import struct
 
 import numpy as np
 
-try:
-    import trimesh  # type: ignore
-    HAS_TRIMESH = True
-except Exception:
-    trimesh = None
-    HAS_TRIMESH = False
+# trimesh is imported on first use (it is slow to import and only needed by
+# load_stl); _MISSING marks "not tried yet", None "not installed".
+_MISSING = object()
+_trimesh = _MISSING
+
+
+def _get_trimesh():
+    """Return the trimesh module, or None if it is not installed."""
+    global _trimesh
+    if _trimesh is _MISSING:
+        try:
+            import trimesh  # type: ignore
+            _trimesh = trimesh
+        except Exception:
+            _trimesh = None
+    return _trimesh
+
+
+# One binary STL facet record: normal(3f), vertices(3x3f), attr(u2)
+_STL_FACET_DTYPE = np.dtype([
+    ('normal', '<f4', (3,)),
+    ('v', '<f4', (3, 3)),
+    ('attr', '<u2'),
+])
+
+# "vertex x y z" lines of an ASCII STL; captures the three coordinates.
+_ASCII_VERTEX_RE = re.compile(r"^\s*vertex[ \t]+(\S+[ \t]+\S+[ \t]+\S+)", re.IGNORECASE | re.MULTILINE)
 
 
 def _unique_rows_tol(points: np.ndarray, decimals: int = 12) -> Tuple[np.ndarray, np.ndarray]:
     """Unique rows with rounding tolerance; returns (unique_rows, inverse_idx)."""
     a = np.asarray(points, dtype=float)
     ar = np.round(a, decimals=decimals)
-    # View as a structured array to use np.unique on rows
-    view = np.ascontiguousarray(ar).view([("f%d" % i, ar.dtype) for i in range(ar.shape[1])])
-    unique, idx, inv = np.unique(view, return_index=True, return_inverse=True)
-    nodes = a[idx]
+    if ar.shape[0] == 0:
+        return a.copy(), np.zeros(0, dtype=np.intp)
+    # Stable lexicographic sort on the columns; equal rows become adjacent and
+    # the first of each run is the earliest occurrence (as np.unique's index).
+    order = np.lexsort(ar.T[::-1])
+    s = ar[order]
+    starts = np.empty(s.shape[0], dtype=bool)
+    starts[0] = True
+    np.any(s[1:] != s[:-1], axis=1, out=starts[1:])
+    inv = np.empty(s.shape[0], dtype=np.intp)
+    inv[order] = np.cumsum(starts) - 1
+    nodes = a[order[starts]]
     return nodes, inv
 
 
-def _parse_stl_binary(data: bytes) -> np.ndarray:
-    """Return triangles array (T, 3, 3) from binary STL bytes."""
-    if len(data) < 84:
-        raise ValueError("Binary STL too small")
-    n_tri = struct.unpack_from('<I', data, offset=80)[0]
-    expect = 84 + 50 * n_tri
-    if len(data) != expect:
-        raise ValueError("Binary STL size does not match triangle count")
-    # Define a structured dtype for one facet: normal(3f), vertices(3x3f), attr(u2)
-    facet_dtype = np.dtype([
-        ('normal', '<f4', (3,)),
-        ('v', '<f4', (3, 3)),
-        ('attr', '<u2'),
-    ])
-    recs = np.frombuffer(data, dtype=facet_dtype, count=n_tri, offset=84)
+def _binary_stl_triangle_count(path: Path) -> Optional[int]:
+    """
+    Triangle count of a binary STL, or None if the file is not binary.
+
+    A binary STL is an 84-byte header (with the uint32 triangle count at
+    offset 80) followed by 50 bytes per triangle, so its size is exact.
+    ASCII files, even those starting with "solid", do not match it.
+    """
+    size = path.stat().st_size
+    if size < 84:
+        return None
+    with path.open('rb') as fh:
+        header = fh.read(84)
+    n_tri = struct.unpack_from('<I', header, offset=80)[0]
+    if size != 84 + 50 * n_tri:
+        return None
+    return n_tri
+
+
+def _parse_stl_binary(path: Path, n_tri: int) -> np.ndarray:
+    """Return triangles array (T, 3, 3) from a binary STL file.
+
+    The facet records are memory-mapped, so the only full copy is the
+    float32 -> float64 cast of the vertices.
+    """
+    if n_tri == 0:
+        return np.zeros((0, 3, 3), dtype=np.float64)
+    recs = np.memmap(path, dtype=_STL_FACET_DTYPE, mode='r', offset=84, shape=(n_tri,))
     triangles = recs['v'].astype(np.float64)
+    del recs
     return triangles
 
 
 def _parse_stl_ascii(text: str) -> np.ndarray:
     """Return triangles array (T, 3, 3) from ASCII STL text."""
-    tris = []
-    cur = []
-    for line in text.splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        if line.lower().startswith('vertex'):
-            parts = line.split()
-            # Format: vertex x y z
-            if len(parts) >= 4:
-                try:
-                    x, y, z = float(parts[1]), float(parts[2]), float(parts[3])
-                    cur.append((x, y, z))
-                except ValueError:
-                    continue
-            if len(cur) == 3:
-                tris.append(cur)
-                cur = []
-    if not tris:
+    # One regex sweep collects "x y z" of every vertex line; NumPy converts
+    # all coordinates at once.
+    coords = _ASCII_VERTEX_RE.findall(text)
+    values = np.array(" ".join(coords).split(), dtype=np.float64)
+    n_tri = values.size // 9
+    if n_tri == 0:
         raise ValueError("No triangles found in ASCII STL")
-    return np.asarray(tris, dtype=np.float64)
+    return values[: n_tri * 9].reshape(n_tri, 3, 3)
 
 
 def load_stl(path: str | Path, merge_vertices: bool = True, decimals: int = 12) -> Tuple[np.ndarray, np.ndarray]:
@@ -80,7 +111,9 @@ def load_stl(path: str | Path, merge_vertices: bool = True, decimals: int = 12)
     path : str or Path
         Path to an STL file.
     merge_vertices : bool, default True
-        If True, merge duplicate vertices.
+        If True, merge duplicate vertices. If False, every triangle keeps its
+        own three vertices (nodes has 3*M rows) and the merge sort is skipped;
+        this is enough for per-face quantities such as surface_area.
     decimals : int, default 12
         Rounding precision used when merging vertices in the fallback parser.
 
@@ -94,8 +127,10 @@ def load_stl(path: str | Path, merge_vertices: bool = True, decimals: int = 12)
         raise FileNotFoundError(f"STL not found: {p}")
 
     # Preferred: trimesh loader
-    if HAS_TRIMESH:
-        mesh = trimesh.load(str(p), process=True, force="mesh")
+    trimesh = _get_trimesh()
+    if trimesh is not None:
+        # process=False: the only cleanup wanted is the optional merge below
+        mesh = trimesh.load(str(p), process=False, force="mesh")
         if not isinstance(mesh, trimesh.Trimesh):
             # Combine scene geometries
             mesh = mesh.dump(concatenate=True)
@@ -106,25 +141,21 @@ def load_stl(path: str | Path, merge_vertices: bool = True, decimals: int = 12)
         return nodes, faces
 
     # Fallback: built-in ASCII/binary parser
-    data = p.read_bytes()
-    triangles = None
-    if len(data) >= 84:
-        try:
-            triangles = _parse_stl_binary(data)
-        except Exception:
-            triangles = None
-    if triangles is None:
-        try:
-            text = data.decode('utf-8', errors='ignore')
+    n_tri = _binary_stl_triangle_count(p)
+    try:
+        if n_tri is not None:
+            triangles = _parse_stl_binary(p, n_tri)
+        else:
+            text = p.read_bytes().decode('utf-8', errors='ignore')
             triangles = _parse_stl_ascii(text)
-        except Exception as e:
-            raise ValueError(f"Could not parse STL file: {e}")
+    except Exception as e:
+        raise ValueError(f"Could not parse STL file: {e}")
 
     verts = triangles.reshape(-1, 3)
     if merge_vertices:
         nodes, inv = _unique_rows_tol(verts, decimals=decimals)
         faces = inv.reshape(-1, 3).astype(np.int32)
     else:
-        nodes = verts.astype(np.float64)
+        nodes = verts  # already a fresh float64 array
         faces = np.arange(nodes.shape[0], dtype=np.int32).reshape(-1, 3)
     return nodes, faces
@@ -10,6 +10,22 @@ def _mean_center(z: np.ndarray) -> Tuple[np.ndarray, float]:
     return z, zm
 
 
+def _all_moments(z: np.ndarray) -> Tuple[float, float, float, float]:
+    """Central moments of z from a single centring pass.
+
+    Returns (mean |d|, mean d^2, mean d^3, mean d^4) with d = z - mean(z).
+    """
+    z, zm = _mean_center(z)
+    d = z.ravel() - zm
+    n = d.size
+    d2 = d * d
+    m2 = float(d2.sum()) / n
+    m3 = float(d2 @ d) / n
+    m4 = float(d2 @ d2) / n
+    ma = float(np.abs(d, out=d2).sum()) / n
+    return ma, m2, m3, m4
+
+
 def sq(z: np.ndarray) -> float:
     """Root mean square (RMS) height of a rough surface.
 
@@ -75,11 +91,14 @@ def sdq(z: np.ndarray, dx: float, dy: float) -> float:
     if M < 2 or N < 2:
         raise ValueError("z must have at least 2x2 samples to compute gradients")
 
-    # Forward differences along columns (x) and rows (y)
-    dZdx = np.diff(Z, n=1, axis=1) / dx  # shape (M, N-1)
-    dZdy = np.diff(Z, n=1, axis=0) / dy  # shape (M-1, N)
+    # Forward differences along columns (x) and rows (y); the sums of squares
+    # are dot products, so no squared temporaries are formed.
+    d = (Z[:, 1:] - Z[:, :-1]).ravel()  # (M, N-1) differences
+    s1 = d @ d
+    d = (Z[1:, :] - Z[:-1, :]).ravel()  # (M-1, N) differences
+    s2 = d @ d
 
-    num = np.sum(dZdx ** 2) + np.sum(dZdy ** 2)
+    num = s1 / (dx * dx) + s2 / (dy * dy)
     denom = (M - 1) * (N - 1)
     return float(np.sqrt(num / denom))
 
@@ -135,9 +154,14 @@ def roughness_functions(z: np.ndarray, dx: float, dy: float) -> Tuple[float, flo
 
     Returns (sq, sa, sdq, sku, ssk).
     """
-    sq_val = sq(z)
-    sa_val = sa(z)
+    # sdq validates the grid (2-D, at least 2x2, positive spacing) first
     sdq_val = sdq(z, dx, dy)
-    sku_val = sku(z, sq_val)
-    ssk_val = ssk(z, sq_val)
+    sa_val, m2, m3, m4 = _all_moments(z)
+    sq_val = float(np.sqrt(m2))
+    if sq_val == 0:
+        sku_val = float(np.inf)
+        ssk_val = float(np.nan)
+    else:
+        sku_val = m4 / (sq_val ** 4)
+        ssk_val = m3 / (sq_val ** 3)
     return sq_val, sa_val, sdq_val, sku_val, ssk_val
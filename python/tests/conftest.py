@@ -1,3 +1,32 @@
 import os, sys
+from pathlib import Path
 # Ensure the package under ../ is importable as `pyshape`
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import numpy as np
+import pytest
+
+
+@pytest.fixture(scope='session', autouse=True)
+def _warm_numba_kernels():
+    # Compile the optional Numba kernels once per session (no-op without
+    # Numba); with cache=True later sessions load them from disk.
+    from pyshape import _form_numba, _geometry_numba
+    if not _geometry_numba.HAS_NUMBA:
+        return
+    nodes = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1]], dtype=np.float64)
+    faces = np.array([[0, 1, 2], [0, 1, 3], [1, 2, 3], [2, 0, 3]], dtype=np.int64)
+    elements = np.array([[0, 1, 2, 3]], dtype=np.int64)
+    _geometry_numba.surface_area(nodes, faces)
+    _geometry_numba.tet_moments(nodes, elements, nodes[0])
+    _form_numba.mesh_stats(nodes, faces)
+
+
+@pytest.fixture(scope='session')
+def tetra_stl():
+    # Parse the tetrahedron STL once per session; returns (nodes, faces)
+    from pyshape import load_stl
+    # Resolve repository root from this file location
+    repo_root = Path(__file__).resolve().parents[2]
+    stl_path = repo_root / "Matlab" / "examples" / "Platonic_solids" / "Tetrahedron.stl"
+    assert stl_path.exists(), f"Missing STL for test: {stl_path}"
+    return load_stl(stl_path)
@@ -1,9 +1,10 @@
 import numpy as np
+import pytest
 from pyshape import surface_area
 
 def test_unit_square_two_tris():
-    nodes = np.array([[0,0,0],[1,0,0],[1,1,0],[0,1,0]], dtype=float)
-    faces = np.array([[0,1,2],[0,2,3]], dtype=int)
+    nodes = np.array([[0,0,0],[1,0,0],[1,1,0],[0,1,0]], dtype=np.float64)
+    faces = np.array([[0,1,2],[0,2,3]], dtype=np.int64)
     assert np.isclose(surface_area(nodes, faces), 1.0)
 
 def test_regular_tetrahedron_edge1():
@@ -13,21 +14,35 @@ def test_regular_tetrahedron_edge1():
         [1.0, 0.0, 0.0],
         [0.5, np.sqrt(3)/2, 0.0],
         [0.5, np.sqrt(3)/6, np.sqrt(2/3)],
-    ], dtype=float)
+    ], dtype=np.float64)
     faces = np.array([
         [0, 1, 2],
         [0, 1, 3],
         [1, 2, 3],
         [2, 0, 3],
-    ], dtype=int)
+    ], dtype=np.int64)
     assert np.isclose(surface_area(nodes, faces), np.sqrt(3), rtol=1e-12, atol=1e-12)
 
 def test_auto_convert_1_based_faces():
-    nodes = np.array([[0,0,0],[1,0,0],[1,1,0],[0,1,0]], dtype=float)
-    faces_1_based = np.array([[1,2,3],[1,3,4]], dtype=int)
+    nodes = np.array([[0,0,0],[1,0,0],[1,1,0],[0,1,0]], dtype=np.float64)
+    faces_1_based = np.array([[1,2,3],[1,3,4]], dtype=np.int64)
     assert np.isclose(surface_area(nodes, faces_1_based), 1.0)
 
 
+def test_surface_area_batched_matches_per_mesh():
+    from pyshape import surface_area_batched
+    square_nodes = np.array([[0,0,0],[1,0,0],[1,1,0],[0,1,0]], dtype=np.float64)
+    square_faces = np.array([[0,1,2],[0,2,3]], dtype=np.int64)
+    tet_nodes = np.array([[0,0,0],[1,0,0],[0,1,0],[0,0,1]], dtype=np.float64)
+    tet_faces = np.array([[0,1,2],[0,1,3],[1,2,3],[2,0,3]], dtype=np.int64)
+    nodes = np.vstack([square_nodes, 2.0 * square_nodes, tet_nodes])
+    faces = np.vstack([square_faces, square_faces + 4, tet_faces + 8])
+    # the last mesh has no faces
+    areas = surface_area_batched(nodes, faces, [0, 2, 4, 8])
+    expected = [1.0, 4.0, surface_area(tet_nodes, tet_faces), 0.0]
+    assert np.allclose(areas, expected, rtol=1e-12, atol=1e-12)
+
+
 def test_volume_centroid_inertia_simple_tet():
     from pyshape import volume_centroid_inertia_tensor
     # Unit right tetra with vertices at origin axes endpoints (volume = 1/6)
@@ -36,8 +51,8 @@ def test_volume_centroid_inertia_simple_tet():
         [1.0, 0.0, 0.0],
         [0.0, 1.0, 0.0],
         [0.0, 0.0, 1.0],
-    ], dtype=float)
-    elements = np.array([[0, 1, 2, 3]], dtype=int)
+    ], dtype=np.float64)
+    elements = np.array([[0, 1, 2, 3]], dtype=np.int64)
     vol, cen, Icur, Idiag, axes = volume_centroid_inertia_tensor(nodes, elements, True)
     assert np.isclose(vol, 1/6)
     assert np.allclose(cen, np.array([0.25, 0.25, 0.25]))
@@ -53,13 +68,46 @@ def test_volume_centroid_inertia_1_based_elements():
         [1.0, 0.0, 0.0],
         [0.0, 1.0, 0.0],
         [0.0, 0.0, 1.0],
-    ], dtype=float)
-    elements_1b = np.array([[1, 2, 3, 4]], dtype=int)
+    ], dtype=np.float64)
+    elements_1b = np.array([[1, 2, 3, 4]], dtype=np.int64)
     vol, cen, Icur, Idiag, axes = volume_centroid_inertia_tensor(nodes, elements_1b, False)
     assert np.isclose(vol, 1/6)
     assert np.allclose(cen, np.array([0.25, 0.25, 0.25]))
 
 
+def test_numba_kernels_match_numpy(monkeypatch):
+    import pyshape.form as form
+    import pyshape.geometry as geometry
+    if not geometry.HAS_NUMBA:
+        pytest.skip("numba not installed")
+
+    rng = np.random.default_rng(0)
+    nodes = rng.random((40, 3)) + 10.0
+    faces = np.array([rng.choice(40, 3, replace=False) for _ in range(60)], dtype=np.int64)
+    elements = np.array([rng.choice(40, 4, replace=False) for _ in range(60)], dtype=np.int64)
+
+    # Force each path by moving the size thresholds
+    results = {}
+    for label, min_size in (("numba", 0), ("numpy", 10**12)):
+        monkeypatch.setattr(geometry, "_NUMBA_MIN_FACES", min_size)
+        monkeypatch.setattr(geometry, "_NUMBA_MIN_ELEMENTS", min_size)
+        results[label] = (
+            geometry.surface_area(nodes, faces),
+            geometry.volume_centroid_inertia_tensor(nodes, elements)[:3],
+            form.surface_orientation_tensor(nodes, faces)[:4],
+            form.mesh_stats(nodes, faces)[:6],
+        )
+
+    nb, ref = results["numba"], results["numpy"]
+    assert np.isclose(nb[0], ref[0], rtol=1e-12)
+    for a, b in zip(nb[1], ref[1]):
+        assert np.allclose(a, b, rtol=1e-10, atol=1e-12)
+    for a, b in zip(nb[2], ref[2]):
+        assert np.allclose(a, b, rtol=1e-10, atol=1e-12)
+    for a, b in zip(nb[3], ref[3]):
+        assert np.allclose(a, b, rtol=1e-10, atol=1e-12)
+
+
 def test_form_metrics_and_orientation_tensor():
     from pyshape import (
         convexity,
@@ -82,14 +130,35 @@ def test_form_metrics_and_orientation_tensor():
     assert np.isclose(sphericity_krumbein(1.0, 2.0, 4.0), ((2*1)/(4*4))**(1/3))
 
     # Orientation tensor on a simple square (two triangles) on XY plane
-    nodes = np.array([[0,0,0],[1,0,0],[1,1,0],[0,1,0]], dtype=float)
-    faces = np.array([[0,1,2],[0,2,3]], dtype=int)
+    nodes = np.array([[0,0,0],[1,0,0],[1,1,0],[0,1,0]], dtype=np.float64)
+    faces = np.array([[0,1,2],[0,2,3]], dtype=np.int64)
     C, F, R, eigvals, eigvecs = surface_orientation_tensor(nodes, faces)
     # For a flat square in XY, normals point along +Z, tensor should reflect planarity
     assert eigvals.shape == (3,)
     assert eigvecs.shape == (3,3)
 
 
+def test_mesh_stats_matches_separate_calls():
+    from pyshape import mesh_stats, surface_orientation_tensor
+    # Closed box with outward normals: 1 x 2 x 3, volume 6, area 22
+    nodes = np.array([
+        [0,0,0],[1,0,0],[1,2,0],[0,2,0],
+        [0,0,3],[1,0,3],[1,2,3],[0,2,3],
+    ], dtype=np.float64)
+    faces = np.array([
+        [0,2,1],[0,3,2],[4,5,6],[4,6,7],
+        [0,1,5],[0,5,4],[2,3,7],[2,7,6],
+        [1,2,6],[1,6,5],[0,4,7],[0,7,3],
+    ], dtype=np.int64)
+    area, volume, C, F, R, eigvals, eigvecs = mesh_stats(nodes, faces)
+    assert np.isclose(area, 22.0)
+    assert np.isclose(volume, 6.0)
+    C0, F0, R0, eigvals0, _ = surface_orientation_tensor(nodes, faces)
+    assert np.allclose([C, F, R], [C0, F0, R0])
+    assert np.allclose(eigvals, eigvals0)
+    assert np.isclose(mesh_stats(nodes, faces[:, ::-1])[1], -6.0)
+
+
 def test_form_wrappers():
     from pyshape import (
         form_functions_1,
@@ -114,18 +183,93 @@ def test_form_wrappers():
     assert np.allclose(form_parameters_zingg(1.0, 2.0, 4.0), (0.5, 0.5))
 
 
-def test_load_stl_and_area():
-    import os
-    from pathlib import Path
-    from pyshape import load_stl, surface_area
+def test_form_functions_1_batch_matches_scalar():
+    from pyshape import form_functions_1, form_functions_1_batch
 
-    # Resolve repository root from this test file location
-    repo_root = Path(__file__).resolve().parents[2]
-    stl_path = repo_root / "examples" / "Platonic_solids" / "Tetrahedron.stl"
-    assert stl_path.exists(), f"Missing STL for test: {stl_path}"
+    A = np.array([10.0, 4.0 * np.pi, 6.0])
+    V = np.array([5.0, 4.0 / 3.0 * np.pi, 0.5])
+    Vch = np.array([6.25, 4.0 / 3.0 * np.pi, 1.0])
+    con, spW = form_functions_1_batch(A, V, Vch)
+    for k in range(A.size):
+        assert np.allclose((con[k], spW[k]), form_functions_1(A[k], V[k], Vch[k]))
+    assert np.isclose(spW[1], 1.0)
+
+
+def test_form_functions_2_batch_matches_scalar():
+    from pyshape import form_functions_2, form_functions_2_batch
 
-    nodes, faces = load_stl(stl_path)
+    S = np.array([1.0, 0.5, 0.0, 2.0])
+    I = np.array([2.0, 0.5, 0.0, 3.0])
+    L = np.array([4.0, 1.0, 1.0, 3.0])
+    batch = form_functions_2_batch(S, I, L)
+    for k in range(S.size):
+        assert np.allclose([b[k] for b in batch], form_functions_2(S[k], I[k], L[k]))
+
+
+def test_load_stl_and_area(tetra_stl):
+    from pyshape import surface_area
+
+    nodes, faces = tetra_stl
     assert nodes.shape[1] == 3 and faces.shape[1] == 3
     assert nodes.shape[0] > 0 and faces.shape[0] > 0
     area = surface_area(nodes, faces)
     assert area > 0
+
+
+def test_load_stl_fallback_parser(monkeypatch, tmp_path):
+    from pathlib import Path
+    import pyshape.io as io
+    from pyshape import load_stl, surface_area
+    # Force the built-in parser even when trimesh is installed
+    monkeypatch.setattr(io, "_trimesh", None)
+
+    repo_root = Path(__file__).resolve().parents[2]
+    ascii_path = repo_root / "python" / "examples" / "assets" / "Tetrahedron_ascii.stl"
+    binary_path = repo_root / "Matlab" / "examples" / "Platonic_solids" / "Hexahedron.stl"
+    assert io._binary_stl_triangle_count(ascii_path) is None
+    assert io._binary_stl_triangle_count(binary_path) == 768
+
+    for path, expected_area in ((ascii_path, 1.5 + np.sqrt(3) / 2), (binary_path, 6.0)):
+        merged_nodes, merged_faces = load_stl(path, merge_vertices=True)
+        nodes, faces = load_stl(path, merge_vertices=False)
+        assert merged_faces.dtype == np.int32 and faces.dtype == np.int32
+        assert nodes.shape == (3 * faces.shape[0], 3)
+        assert merged_nodes.shape[0] < nodes.shape[0]
+        assert len(np.unique(merged_nodes, axis=0)) == merged_nodes.shape[0]
+        # Both variants describe the same triangles
+        assert np.array_equal(merged_nodes[merged_faces], nodes[faces])
+        assert np.isclose(surface_area(merged_nodes, merged_faces), expected_area, rtol=1e-5)
+        assert np.isclose(surface_area(nodes, faces), expected_area, rtol=1e-5)
+
+    # Malformed coordinates are reported instead of being skipped
+    bad = tmp_path / "bad.stl"
+    bad.write_text(
+        "solid bad\n facet normal 0 0 1\n  outer loop\n"
+        "   vertex 0 0 0\n   vertex 1 0 x\n   vertex 0 1 0\n"
+        "  endloop\n endfacet\nendsolid bad\n"
+    )
+    with pytest.raises(ValueError):
+        load_stl(bad)
+
+
+def test_roughness_functions_matches_individual_metrics():
+    from pyshape import roughness_functions, sa, sdq, sku, sq, ssk
+    rng = np.random.default_rng(0)
+    z = rng.random((30, 40))
+    sq_val, sa_val, sdq_val, sku_val, ssk_val = roughness_functions(z, 0.1, 0.2)
+    assert np.isclose(sq_val, sq(z), rtol=1e-12)
+    assert np.isclose(sa_val, sa(z), rtol=1e-12)
+    assert np.isclose(sdq_val, sdq(z, 0.1, 0.2), rtol=1e-12)
+    assert np.isclose(sku_val, sku(z), rtol=1e-12)
+    assert np.isclose(ssk_val, ssk(z), rtol=1e-10)
+
+    # Flat surface: zero Sq gives inf kurtosis and nan skewness
+    flat = np.full((5, 6), 2.5)
+    sq_val, sa_val, sdq_val, sku_val, ssk_val = roughness_functions(flat, 1.0, 1.0)
+    assert sq_val == 0.0 and sa_val == 0.0 and sdq_val == 0.0
+    assert np.isinf(sku_val) and sku(flat) == sku_val
+    assert np.isnan(ssk_val) and np.isnan(ssk(flat))
+
+    # Too-small grids are rejected by the input validation
+    with pytest.raises(ValueError):
+        roughness_functions(np.empty((0, 0)), 1.0, 1.0)